@@ -19,6 +19,6 @@ Usage::
 __version__ = '1.0.1'
 
 from . import interfaces, currency, validation
-from .validation import validate
+from .validation import validate, validate_many, validate_many_packed
 from .currency import Currency
 from .validation import ValidatorBase, Base58CheckValidator, EthereumValidator
@@ -0,0 +1,75 @@
+"""
+:mod:`coinaddr.base58`
+~~~~~~~~~~~~~~~~~~~~~~
+
+Base58 encoding/decoding with custom charset support.
+
+Uses the compiled `based58` package when it is installed, otherwise falls
+back to the pure python `base58check` package.  Custom charsets (ie: ripple)
+are transliterated to/from the standard bitcoin charset around the backend
+call, so the backend only ever needs to know about a single alphabet.
+"""
+
+import functools
+
+try:
+    from based58 import b58decode as _b58decode, b58encode as _b58encode
+except ImportError:
+    from base58check import b58decode as _b58decode, b58encode as _b58encode
+
+
+DEFAULT_CHARSET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+
+@functools.lru_cache(maxsize=None)
+def _translation_tables(charset):
+    """Return tuple (decode table, encode table) for a custom charset.
+
+    Bytes outside of the charset are mapped to NUL, which no base58 alphabet
+    contains, so they are still rejected by the backend decoder.
+    """
+    decode_table, encode_table = bytearray(256), bytearray(256)
+    for custom, default in zip(charset, DEFAULT_CHARSET):
+        decode_table[custom] = default
+        encode_table[default] = custom
+    return bytes(decode_table), bytes(encode_table)
+
+
+def b58decode(val, charset=DEFAULT_CHARSET):
+    """Decode base58 encoded bytes `val` using `charset`."""
+    if charset != DEFAULT_CHARSET:
+        val = val.translate(_translation_tables(charset)[0])
+    return _b58decode(val)
+
+
+def b58encode(val, charset=DEFAULT_CHARSET):
+    """Encode bytes `val` to base58 using `charset`."""
+    encoded = _b58encode(val)
+    if charset != DEFAULT_CHARSET:
+        encoded = encoded.translate(_translation_tables(charset)[1])
+    return encoded
+
+
+def leading_chars(version_bytes, lengths, charset=DEFAULT_CHARSET):
+    """Return mapping of encoded length -> frozenset of leading characters.
+
+    For every encoded length in `lengths`, collect each character that an
+    encoding of bytes starting with one of `version_bytes` can start with.
+    Used to reject addresses by their first character before decoding.
+    """
+    leading = {length: set() for length in lengths}
+    for version in version_bytes:
+        if version == 0:
+            # Leading null bytes always encode to leading zero digits.
+            for chars in leading.values():
+                chars.add(charset[0])
+            continue
+        for size in range(1, max(lengths) + 1):
+            low = version << 8 * (size - 1)
+            high = ((version + 1) << 8 * (size - 1)) - 1
+            for length, chars in leading.items():
+                unit = 58 ** (length - 1)
+                first, last = max(low, unit), min(high, 58 * unit - 1)
+                if first <= last:
+                    chars.update(charset[first // unit:last // unit + 1])
+    return {length: frozenset(chars) for length, chars in leading.items()}
@@ -126,11 +126,18 @@ def decode_block(data, buf, index):
 
 def decode(enc):
     '''Decode a base58 string (ex: a Monero address) into hexidecimal form.'''
-    enc = bytearray(enc, encoding='ascii')
+    return _binToHex(decode_bin(enc))
+
+
+def decode_bin(enc):
+    '''Decode a base58 string or ascii bytes into a bytearray.'''
+    if isinstance(enc, str):
+        enc = enc.encode('ascii')
+    enc = bytearray(enc)
     l_enc = len(enc)
 
     if l_enc == 0:
-        return ""
+        return bytearray()
 
     full_block_count = l_enc // __fullEncodedBlockSize
     last_block_size = l_enc % __fullEncodedBlockSize
@@ -148,4 +155,4 @@ def decode(enc):
     if last_block_size > 0:
         data = decode_block(enc[(full_block_count*__fullEncodedBlockSize):(full_block_count*__fullEncodedBlockSize+last_block_size)], data, full_block_count * __fullBlockSize)
 
-    return _binToHex(data)
+    return data
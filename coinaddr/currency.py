@@ -5,6 +5,8 @@
 Containers for holding all the necessary data for validating cryptocurrencies.
 """
 
+from itertools import chain
+
 import attr
 from zope.interface import implementer, provider
 
@@ -12,18 +14,39 @@ from .interfaces import ICurrency, INamedInstanceContainer
 from .base import NamedInstanceContainerBase
 
 
+def _index(instances):
+    """Return name/ticker -> currency mapping, first match in given order."""
+    index = dict()
+    for inst in instances:
+        index.setdefault(inst.name, inst)
+        index.setdefault(inst.ticker, inst)
+    return index
+
+
+class CurrencyContainerBase(NamedInstanceContainerBase):
+    """A Container for currencies, indexed by both name and ticker."""
+
+    def __init__(cls, name, bases, idict):
+        super(CurrencyContainerBase, cls).__init__(name, bases, idict)
+        cls.index = dict()
+
+    def __setitem__(cls, name, obj):
+        super(CurrencyContainerBase, cls).__setitem__(name, obj)
+        cls.index = _index(cls.instances.values())
+
+    def __delitem__(cls, name):
+        super(CurrencyContainerBase, cls).__delitem__(name)
+        cls.index = _index(cls.instances.values())
+
+
 @provider(INamedInstanceContainer)
-class Currencies(metaclass=NamedInstanceContainerBase):
+class Currencies(metaclass=CurrencyContainerBase):
     """Container for all currencies."""
 
     @classmethod
     def get(cls, name, default=None):
         """Return currency object with matching name or ticker."""
-        for inst in cls.instances.values():
-            if name in (inst.name, inst.ticker):
-                return inst
-        else:
-            return default
+        return cls.index.get(name, default)
 
 
 class CurrencyMeta(type):
@@ -58,6 +81,31 @@ class Currency(metaclass=CurrencyMeta):
         validator=attr.validators.optional(attr.validators.instance_of(bytes)),
         default=None)
 
+    # Values derived from the (immutable) specification, precomputed for
+    # validation.  Entries only some validators need, and the validator
+    # class (validators register after currencies), are added lazily.
+    _cache = attr.ib(init=False, repr=False, default=attr.Factory(dict))
+
+    def __attrs_post_init__(self):
+        """Precompute values derived from the (immutable) specification."""
+        version_bytes = tuple(chain.from_iterable(self.networks.values()))
+        network_names = dict()
+        for name, networks in self.networks.items():
+            for netbyte in networks:
+                network_names.setdefault(netbyte, name)
+        self._cache.update(
+            version_bytes=version_bytes,
+            version_byte_set=frozenset(version_bytes),
+            network_names=network_names,
+            monero_standard_bytes=frozenset(chain(
+                *(self.networks.get(name, ())
+                  for name in ('main', 'test', 'stage')))),
+            monero_integrated_bytes=frozenset(chain(
+                *(self.networks.get(name, ())
+                  for name in ('main_integrated', 'test_integrated',
+                               'stage_integrated')))),
+            extras=dict(charset=self.charset) if self.charset else {})
+
 
 Currency('bitcoin', ticker='btc', validator='Base58Check',
          networks=dict(
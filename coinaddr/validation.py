@@ -1,4 +1,4 @@
-# pylint: disable=no-member
+# pylint: disable=no-member,protected-access
 
 """
 :mod:`coinaddr.validation`
@@ -9,25 +9,109 @@ Various validation machinery for validating cryptocurrency addresses.
 
 import re
 from hashlib import sha256
-import functools
-import operator
-from binascii import unhexlify
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from zope.interface import implementer, provider
 import attr
 import sha3
-import base58check
 
 from .interfaces import (
     INamedSubclassContainer, IValidator, IValidationRequest,
-    IValidationResult, ICurrency
+    IValidationResult
     )
 from .base import NamedSubclassContainerBase
-from . import currency, base58_xmr
+from . import base58, base58_xmr
+from .currency import Currencies, Currency
 from .segwit_addr import bech32_decode
 from .exceptions import CoinaddrException
 
 
+def double_sha256(data):
+    """Return sha256(sha256(data)) digest, as used by Base58Check checksums.
+
+    hashlib is backed by OpenSSL, which already dispatches to SHA-NI/AVX2
+    sha256 implementations at runtime where the CPU supports them.
+    """
+    return sha256(sha256(data).digest()).digest()
+
+
+def _immutable(cls):
+    """Class decorator making instances immutable once constructed.
+
+    Instances are populated with `object.__setattr__` in `__init__`, and
+    likewise restored by `__setstate__` for pickle and copy.
+    """
+    def __setattr__(self, name, value):
+        raise attr.exceptions.FrozenInstanceError()
+
+    def __delattr__(self, name):
+        raise attr.exceptions.FrozenInstanceError()
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', ()))
+        for klass in type(self).__mro__:
+            for name in getattr(klass, '__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    cls.__setattr__ = __setattr__
+    cls.__delattr__ = __delattr__
+    cls.__getstate__ = __getstate__
+    cls.__setstate__ = __setstate__
+    return cls
+
+
+def _get_currency(name):
+    """Return the currency with matching name or ticker, or raise."""
+    if isinstance(name, Currency):
+        return name
+    currency = Currencies.get(name)
+    if not isinstance(currency, Currency):
+        raise TypeError('unknown currency: %r' % (name, ))
+    return currency
+
+
+def _address_bytes(address):
+    """Return address as bytes, encoding str addresses.
+
+    Non-ascii str addresses are utf-8 encoded rather than rejected, the
+    resulting non-ascii bytes are invalid for every validator.
+    """
+    if isinstance(address, bytes):
+        return address
+    return address.encode('utf-8')
+
+
+def _validator_class(currency):
+    """Return the validator class for currency, cached on the currency."""
+    try:
+        return currency._cache['validator_class']
+    except KeyError:
+        validator_cls = Validators.get(currency.validator)
+        currency._cache['validator_class'] = validator_cls
+        return validator_cls
+
+
+def _repr(obj, *fields):
+    """Return a repr of `obj` showing the given fields."""
+    return '%s(%s)' % (type(obj).__name__, ', '.join(
+        '%s=%r' % (field, getattr(obj, field)) for field in fields))
+
+
+def _byte_table(chars):
+    """Return a translation table mapping `chars` to 1, all else to 0."""
+    table = bytearray(256)
+    for char in chars:
+        table[char] = 1
+    return bytes(table)
+
+
 @provider(INamedSubclassContainer)
 class Validators(metaclass=NamedSubclassContainerBase):
     """Container for all validators."""
@@ -40,22 +124,26 @@ class ValidatorMeta(type):
         new = type.__new__(mcs, cls, bases, attrs)
         if new.name:
             Validators[new.name] = new
+            # Drop validator classes cached on currencies by name, so they
+            # pick up this (possibly overriding) validator.
+            for inst in Currencies.instances.values():
+                if inst.validator == new.name:
+                    inst._cache.pop('validator_class', None)
         return new
 
 
-@attr.s(cmp=False, slots=True)
 class ValidatorBase(metaclass=ValidatorMeta):
     """Validator Interface."""
 
+    __slots__ = ('request',)
+
     name = None
 
-    request = attr.ib(
-        type='ValidationRequest',
-        validator=[
-            lambda i, a, v: type(v).__name__ == 'ValidationRequest',
-            attr.validators.provides(IValidationRequest)
-            ]
-    )
+    def __init__(self, request):
+        object.__setattr__(self, 'request', request)
+
+    def __repr__(self):
+        return _repr(self, 'request')
 
     def validate(self):
         """Validate the address type, return True if valid, else False."""
@@ -65,90 +153,155 @@ class ValidatorBase(metaclass=ValidatorMeta):
         """Return the network derived from the network version bytes."""
 
 
-@attr.s(frozen=True, slots=True, cmp=False)
+@_immutable
 @implementer(IValidator)
 class Base58CheckValidator(ValidatorBase):
     """Validates Base58Check based cryptocurrency addresses."""
 
+    __slots__ = ('_decoded',)
+
     name = 'Base58Check'
 
+    def __init__(self, request):
+        super(Base58CheckValidator, self).__init__(request)
+        object.__setattr__(self, '_decoded', None)
+
+    def _decode(self):
+        """Return the decoded address bytes, decoding only once."""
+        if self._decoded is None:
+            try:
+                abytes = base58.b58decode(
+                    self.request.address,
+                    **self.request.currency._cache['extras'])
+            except ValueError:
+                # Undecodable addresses are invalid, with no version byte.
+                abytes = b''
+            object.__setattr__(self, '_decoded', abytes)
+        return self._decoded
+
+    def _leading_chars(self):
+        """Return mapping of address length -> possible first characters.
+
+        Computed once per currency, for the 25 to 35 character addresses.
+        """
+        currency = self.request.currency
+        try:
+            return currency._cache['base58_leading_chars']
+        except KeyError:
+            leading_chars = base58.leading_chars(
+                currency._cache['version_bytes'], range(25, 36),
+                currency.charset or base58.DEFAULT_CHARSET)
+            currency._cache['base58_leading_chars'] = leading_chars
+            return leading_chars
+
     def validate(self):
         """Validate the address."""
-        if 25 > len(self.request.address) > 35:
+        address = self.request.address
+        if not 25 <= len(address) <= 35:
+            return False
+        # Reject addresses whose first character no version byte encodes to.
+        if address[0] not in self._leading_chars()[len(address)]:
             return False
 
-        abytes = base58check.b58decode(
-            self.request.address, **self.request.extras)
-        if not abytes[0] in self.request.networks:
+        abytes = self._decode()
+        netbytes = self.request.currency._cache['version_byte_set']
+        if not abytes or abytes[0] not in netbytes:
             return False
 
-        checksum = sha256(sha256(abytes[:-4]).digest()).digest()[:4]
-        if abytes[-4:] != checksum:
+        if abytes[-4:] != double_sha256(abytes[:-4])[:4]:
             return False
 
-        return self.request.address == base58check.b58encode(
-            abytes, **self.request.extras)
+        # Canonical encoding: one leading zero digit per leading null byte.
+        zero = (self.request.currency.charset or base58.DEFAULT_CHARSET)[:1]
+        return (len(address) - len(address.lstrip(zero)) ==
+                len(abytes) - len(abytes.lstrip(b'\x00')))
 
     @property
     def network(self):
         """Return network derived from network version bytes."""
-        abytes = base58check.b58decode(
-            self.request.address, **self.request.extras)
+        abytes = self._decode()
+        if not abytes:
+            return 'unknown'
 
         nbyte = abytes[0]
-        for name, networks in self.request.currency.networks.items():
-            if nbyte in networks:
-                return name
-        return 'unknown'
+        network_names = self.request.currency._cache['network_names']
+        return network_names.get(nbyte, 'unknown')
 
 
-@attr.s(frozen=True, slots=True, cmp=False)
+@_immutable
 @implementer(IValidator)
 class SegWitValidator(ValidatorBase):
     """Validates SegWit based cryptocurrency addresses."""
 
+    __slots__ = ()
+
     name = 'SegWitCheck'
 
     def validate(self):
         """Validate the address."""
-        hrp, data = bech32_decode(self.request.address.decode())
+        hrp, data = bech32_decode(
+            self.request.address.decode('ascii', 'replace'))
         return bool(hrp) and bool(data)
 
     @property
     def network(self):
         """Return network derived from network version bytes."""
-        hrp, data = bech32_decode(self.request.address.decode())
-        for name, networks in self.request.currency.networks.items():
-            if hrp in networks:
-                return name
-        return 'unknown'
+        hrp, data = bech32_decode(
+            self.request.address.decode('ascii', 'replace'))
+        network_names = self.request.currency._cache['network_names']
+        return network_names.get(hrp, 'unknown')
 
 
-@attr.s(frozen=True, slots=True, cmp=False)
+@_immutable
 @implementer(IValidator)
 class EthereumValidator(ValidatorBase):
     """Validates ethereum based crytocurrency addresses."""
 
+    __slots__ = ()
+
     name = 'Ethereum'
     non_checksummed_patterns = (
-        re.compile("^(0x)?[0-9a-f]{40}$"), re.compile("^(0x)?[0-9A-F]{40}$")
+        re.compile(b"^(0x)?[0-9a-f]{40}$"), re.compile(b"^(0x)?[0-9A-F]{40}$")
         )
+    checksummed_pattern = re.compile(b"^(0x)?[0-9a-fA-F]{40}$")
+
+    # Translation tables mapping digest bytes to 1 if their high/low
+    # nibble is >= 8, and hex characters to 1 if they are (upper) letters.
+    _high_nibble_set = _byte_table(bytes(range(0x80, 0x100)))
+    _low_nibble_set = _byte_table(
+        bytes(byte for byte in range(0x100) if byte & 0x08))
+    _letters = _byte_table(b'abcdefABCDEF')
+    _upper_letters = _byte_table(b'ABCDEF')
+
+    @classmethod
+    def checksum_valid(cls, addr, digest):
+        """Return True if the case of hex address bytes matches the digest.
+
+        Every letter must be uppercase where the matching nibble of the
+        keccak digest is >= 8, and lowercase otherwise.  All 40 characters
+        are checked at once by translating them to 0/1 bytes and comparing
+        them as integers, instead of looping over them in python.
+        """
+        digest = digest[:len(addr) // 2]
+        nibbles = bytearray(2 * len(digest))
+        nibbles[0::2] = digest.translate(cls._high_nibble_set)
+        nibbles[1::2] = digest.translate(cls._low_nibble_set)
+        expected = int.from_bytes(nibbles, 'big')
+        letters = int.from_bytes(addr.translate(cls._letters), 'big')
+        upper = int.from_bytes(addr.translate(cls._upper_letters), 'big')
+        return expected & letters == upper
 
     def validate(self):
         """Validate the address."""
-        address = self.request.address.decode()
+        address = self.request.address
         if any(bool(pat.match(address))
                for pat in self.non_checksummed_patterns):
             return True
-        addr = address[2:] if address.startswith('0x') else address
-        addr_hash = sha3.keccak_256(addr.lower().encode('ascii')).hexdigest()
-        for i, letter in enumerate(addr):
-            if any([
-                    int(addr_hash[i], 16) >= 8 and letter.upper() != letter,
-                    int(addr_hash[i], 16) < 8 and letter.lower() != letter
-            ]):
-                return False
-        return True
+        if not self.checksummed_pattern.match(address):
+            return False
+        addr = address[2:] if address.startswith(b'0x') else address
+        digest = sha3.keccak_256(addr.lower()).digest()
+        return self.checksum_valid(addr, digest)
 
     @property
     def network(self):
@@ -156,80 +309,100 @@ class EthereumValidator(ValidatorBase):
         return 'both'
 
 
-@attr.s(frozen=True, slots=True, cmp=False)
+@_immutable
 @implementer(IValidator)
 class MoneroValidator(ValidatorBase):
     """Validates monero based cryptocurrency addresses."""
 
+    __slots__ = ('_decoded',)
+
     name = 'Monero'
-    address_regex = re.compile(r'^[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{95}$')
-    integrated_address_regex = re.compile(r'^[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{106}$')
+    address_regex = re.compile(rb'^[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{95}$')
+    integrated_address_regex = re.compile(rb'^[123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]{106}$')
+
+    def __init__(self, request):
+        super(MoneroValidator, self).__init__(request)
+        object.__setattr__(self, '_decoded', None)
 
     @staticmethod
     def decode(address):
-        """Return tuple (netbyte, valid checksum)"""
-        decoded = bytearray(unhexlify(base58_xmr.decode(address)))
+        """Return tuple (netbyte, valid checksum), (None, False) if invalid"""
+        try:
+            decoded = base58_xmr.decode_bin(address)
+        except ValueError:
+            return None, False
+        if not decoded:
+            return None, False
         return decoded[0], decoded[-4:] == sha3.keccak_256(decoded[:-4]).digest()[:4]
 
+    def _decode(self):
+        """Return tuple (netbyte, valid checksum), decoding only once."""
+        if self._decoded is None:
+            object.__setattr__(
+                self, '_decoded', self.decode(self.request.address))
+        return self._decoded
+
     def validate(self):
         """Validate the address"""
-        address = self.request.address.decode()
+        address = self.request.address
+        cache = self.request.currency._cache
         if self.address_regex.match(address):
-            netbyte, valid = self.decode(address)
-            return (netbyte in (self.request.currency.networks['main'] +
-                                self.request.currency.networks['test'] +
-                                self.request.currency.networks['stage'])) and valid
+            netbyte, valid = self._decode()
+            return netbyte in cache['monero_standard_bytes'] and valid
         elif self.integrated_address_regex.match(address):
-            netbyte, valid = self.decode(address)
-            return (netbyte in (self.request.currency.networks['main_integrated'] +
-                                self.request.currency.networks['test_integrated'] +
-                                self.request.currency.networks['stage_integrated'])) and valid
+            netbyte, valid = self._decode()
+            return netbyte in cache['monero_integrated_bytes'] and valid
         return False
 
     @property
     def network(self):
         """Return network derived from network version bytes"""
-        netbyte, valid = self.decode(self.request.address.decode())
-        for name, networks in self.request.currency.networks.items():
-            if netbyte in networks:
-                return name
-        return 'unknown'
+        netbyte, valid = self._decode()
+        network_names = self.request.currency._cache['network_names']
+        return network_names.get(netbyte, 'unknown')
 
 
-@attr.s(frozen=True, slots=True, cmp=False)
+@_immutable
 @implementer(IValidationRequest)
 class ValidationRequest:
     """Contain the data and helpers as an immutable request object."""
 
-    currency = attr.ib(
-        type=currency.Currency,
-        converter=currency.Currencies.get,
-        validator=[
-            attr.validators.instance_of(currency.Currency),
-            attr.validators.provides(ICurrency)
-            ])
-    address = attr.ib(
-        type=bytes,
-        converter=lambda a: a if isinstance(a, bytes) else a.encode('ascii'),
-        validator=attr.validators.instance_of(bytes))
+    __slots__ = ('currency', 'address')
+
+    def __init__(self, currency, address):
+        currency = _get_currency(currency)
+        address = _address_bytes(address)
+        object.__setattr__(self, 'currency', currency)
+        object.__setattr__(self, 'address', address)
+
+    @classmethod
+    def from_currency(cls, currency, address):
+        """Return a request for a Currency instance, skipping all checks.
+
+        For high volume callers which already hold the Currency object.
+        """
+        request = cls.__new__(cls)
+        address = _address_bytes(address)
+        object.__setattr__(request, 'currency', currency)
+        object.__setattr__(request, 'address', address)
+        return request
+
+    def __repr__(self):
+        return _repr(self, 'currency', 'address')
 
     @property
     def extras(self):
         """Extra arguments for passing to decoder, etc."""
-        extras = dict()
-        if self.currency.charset:
-            extras.setdefault('charset', self.currency.charset)
-        return extras
+        return MappingProxyType(self.currency._cache['extras'])
 
     @property
     def networks(self):
         """Concatenated list of all version bytes for currency."""
-        networks = tuple(self.currency.networks.values())
-        return functools.reduce(operator.concat, networks)
+        return self.currency._cache['version_bytes']
 
     def execute(self):
         """Execute this request and return the result."""
-        validator = Validators.get(self.currency.validator)(self)
+        validator = _validator_class(self.currency)(self)
         try:
             return ValidationResult(
                 name=self.currency.name,
@@ -242,26 +415,24 @@ class ValidationRequest:
             raise CoinaddrException(e)
 
 
-@attr.s(frozen=True, slots=True, cmp=False)
+@_immutable
 @implementer(IValidationResult)
 class ValidationResult:
     """Contains an immutable representation of the validation result."""
 
-    name = attr.ib(
-        type=str,
-        validator=attr.validators.instance_of(str))
-    ticker = attr.ib(
-        type=str,
-        validator=attr.validators.instance_of(str))
-    address = attr.ib(
-        type=bytes,
-        validator=attr.validators.instance_of(bytes))
-    valid = attr.ib(
-        type=bool,
-        validator=attr.validators.instance_of(bool))
-    network = attr.ib(
-        type=str,
-        validator=attr.validators.instance_of(str))
+    __slots__ = ('name', 'ticker', 'address', 'valid', 'network')
+
+    # Built only by ValidationRequest.execute from already validated data,
+    # so the fields are not re-validated on every result.
+    def __init__(self, name, ticker, address, valid, network):
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'ticker', ticker)
+        object.__setattr__(self, 'address', address)
+        object.__setattr__(self, 'valid', valid)
+        object.__setattr__(self, 'network', network)
+
+    def __repr__(self):
+        return _repr(self, 'name', 'ticker', 'address', 'valid', 'network')
 
     def __bool__(self):
         return self.valid
@@ -272,7 +443,8 @@ def validate(currency, address):
 
     This is the main entrypoint for using this library.
 
-    :param currency str: The name or ticker code of the cryptocurrency.
+    :param currency (str, Currency): The cryptocurrency, or its name or
+        ticker code.
     :param address (bytes, str): The crytocurrency address to validate.
     :return: a populated ValidationResult object
     :rtype: :inst:`ValidationResult`
@@ -288,3 +460,113 @@ def validate(currency, address):
     """
     request = ValidationRequest(currency, address)
     return request.execute()
+
+
+# Batches at or below this size are always validated on the calling thread.
+PARALLEL_THRESHOLD = 256
+
+
+def _run_chunked(func, count, workers):
+    """Call func(start, stop) over chunks of range(count).
+
+    Chunks run on a pool of `workers` threads when there is more than one
+    worker and more than PARALLEL_THRESHOLD items, else on this thread.
+    """
+    if not workers or workers < 2 or count <= PARALLEL_THRESHOLD:
+        func(0, count)
+        return
+    size = -(-count // workers)
+    with ThreadPoolExecutor(workers) as executor:
+        futures = [executor.submit(func, start, min(start + size, count))
+                   for start in range(0, count, size)]
+        for future in futures:
+            future.result()
+
+
+def validate_many(currency, addresses, workers=None):
+    """Validate each of the given addresses according to currency type.
+
+    Bulk counterpart of :func:`validate`.
+
+    Validation is pure python, so spreading a batch over `workers` threads
+    only speeds it up on free-threaded (no GIL) python builds.
+
+    :param currency (str, Currency): The cryptocurrency, or its name or
+        ticker code.
+    :param addresses iterable: The (bytes, str) crytocurrency addresses.
+    :param workers int: (optional) Number of threads for large batches.
+    :return: a list of populated ValidationResult objects, in order
+    :rtype: list
+
+    Usage::
+
+      >>> import coinaddr
+      >>> coinaddr.validate_many(
+      ...     'btc', [b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT'])
+      [ValidationResult(name='bitcoin', ticker='btc',
+      ...               address=b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT',
+      ...               valid=True, network='main')]
+
+    """
+    currency = _get_currency(currency)
+    addresses = list(addresses)
+    results = [None] * len(addresses)
+
+    def validate_chunk(start, stop):
+        for i in range(start, stop):
+            results[i] = ValidationRequest.from_currency(
+                currency, addresses[i]).execute()
+
+    _run_chunked(validate_chunk, len(addresses), workers)
+    return results
+
+
+def validate_many_packed(currency, buf, stride, workers=None):
+    """Validate addresses packed into one contiguous buffer.
+
+    Each address occupies `stride` bytes of `buf`, right padded with null
+    bytes, so the input holds millions of addresses in a single object (ie:
+    a numpy array of dtype 'S34').  Addresses are still validated one at a
+    time, each through a short lived request and validator; only validity
+    is reported, so no ValidationResult objects are built or kept.
+
+    :param currency (str, Currency): The cryptocurrency, or its name or
+        ticker code.
+    :param buf: Any C-contiguous object supporting the buffer protocol.
+    :param stride int: The fixed number of bytes per address.
+    :param workers int: (optional) Number of threads for large batches, see
+        :func:`validate_many`.
+    :return: one byte per address, 1 if valid, else 0
+    :rtype: bytearray
+
+    Usage::
+
+      >>> import coinaddr
+      >>> coinaddr.validate_many_packed(
+      ...     'btc', b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT\\x00', 35)
+      bytearray(b'\\x01')
+
+    """
+    view = memoryview(buf).cast('B')
+    if stride < 1 or len(view) % stride:
+        raise ValueError(
+            'buffer length %d is not a multiple of stride %d' %
+            (len(view), stride))
+
+    currency = _get_currency(currency)
+    validator_cls = _validator_class(currency)
+    flags = bytearray(len(view) // stride)
+
+    def validate_chunk(start, stop):
+        for i in range(start, stop):
+            offset = i * stride
+            address = view[offset:offset + stride].tobytes().rstrip(b'\x00')
+            validator = validator_cls(
+                ValidationRequest.from_currency(currency, address))
+            try:
+                flags[i] = validator.validate()
+            except Exception as e:
+                raise CoinaddrException(e)
+
+    _run_chunked(validate_chunk, len(flags), workers)
+    return flags
@@ -45,6 +45,9 @@ setup(
         'base58check>=1.0.1',
         'zope.interface>=4.4.3'
     ],
+    extras_require={
+        'speedups': ['based58>=0.1.0'],
+    },
     zip_safe=False,
     packages=find_packages(),
     package_data={'': ['LICENSE']},
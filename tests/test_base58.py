@@ -0,0 +1,44 @@
+import unittest
+
+from coinaddr import base58
+
+
+RIPPLE_CHARSET = (b'rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcd'
+                  b'eCg65jkm8oFqi1tuvAxyz')
+
+TEST_DATA = [
+    (b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT', base58.DEFAULT_CHARSET),
+    (b'11111111111111111111111111', base58.DEFAULT_CHARSET),
+    (b'rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn', RIPPLE_CHARSET),
+    (b'rrrrrrrrrrrrrrrrrrrrrhoLvTp', RIPPLE_CHARSET),
+]
+
+
+class TestBase58(unittest.TestCase):
+    def test_round_trip(self):
+        for encoded, charset in TEST_DATA:
+            with self.subTest(encoded=encoded, charset=charset):
+                decoded = base58.b58decode(encoded, charset=charset)
+                self.assertEqual(
+                    encoded, base58.b58encode(decoded, charset=charset))
+
+    def test_invalid_characters(self):
+        for encoded, charset in [(b'0OIl', base58.DEFAULT_CHARSET),
+                                 (b'0OIl', RIPPLE_CHARSET)]:
+            with self.subTest(encoded=encoded, charset=charset):
+                with self.assertRaises(ValueError):
+                    base58.b58decode(encoded, charset=charset)
+
+    def test_leading_chars(self):
+        leading = base58.leading_chars((0x00, 0x05, 0x30), range(25, 36))
+        for encoded in [b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT',
+                        b'11111111111111111111111111',
+                        b'3QJmV3qfvL9SuYo34YihAf3sRCW3qSinyC',
+                        b'LeF6vC9k1qfFDEj6UGjM5e4fwHtiKsakTd']:
+            with self.subTest(encoded=encoded):
+                self.assertIn(encoded[0], leading[len(encoded)])
+        self.assertNotIn(b'n'[0], leading[34])
+
+
+if __name__ == '__main__':
+    unittest.main()
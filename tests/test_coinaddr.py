@@ -9,7 +9,7 @@ from coinaddr.interfaces import (
 from coinaddr.currency import Currencies, Currency
 from coinaddr.validation import (
     Validators, ValidatorBase, ValidationRequest, ValidationResult,
-    Base58CheckValidator, EthereumValidator
+    Base58CheckValidator, EthereumValidator, MoneroValidator
     )
 
 
@@ -27,12 +27,19 @@ TEST_DATA = [
     ('dogecoin', 'doge', b'njscgXBB3HUUTXH7njim1Uw82PF9da4R8k', 'test'),
     ('dashcoin', 'dash', b'XsVkhTxLjzdXP1xZWtEFRj1mDhWcU6d8tE', 'main'),
     ('dashcoin', 'dash', b'yPv7h2i8v3dJjfSH4L3x91JSJszjdbsJJA', 'test'),
+    ('ripple', 'xrp', b'rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jpn', 'both'),
     ('ether-zero', 'etz', b'900ff070d37657cdf8016bca0d60cb493ebf7f83', 'both'),
     ('ethereum-classic', 'etc',
      b'0x900ff070d37657cdf8016bca0d60cb493ebf7f83', 'both'),
     ('ethereum', 'eth', b'900Ff070D37657cdF8016BcA0D60CB493EBf7f83', 'both'),
     ('ethereum-classic', 'etc',
      b'0x900Ff070D37657cdF8016BcA0D60CB493EBf7f83', 'both'),
+    ('monero', 'xmr',
+     b'4A5PR5LuKrDHjHBAMQ32WH9Bkb4gX8YBCBqY7xszgfBMWuN5EJY3wrGFyh8KzJ9s9PMg'
+     b'w99DuJtRDYFbF5hooRS5HSpofmt', 'main'),
+    ('monero', 'xmr',
+     b'4FnZeDBBrdzRTALhiQEXrs6mnWTxHCajVRwjrusMLpihBhWHt1BuUdsY9cTYcRxEiSCu'
+     b'L1zxBYqXkVP15QA2G4R44gdQ5RZKHof4KCJQJN', 'main_integrated'),
     ('binance', 'bnb', b'bnb1usaafxe5tunqx0wmgv8dcq0meujlvq6fyfvw5d', 'both'),
     ('binance', 'bnb', b'bnb1p43f9ft5jzpl9n4w7h2nzjuwfzhfwhm0h9q94e', 'both'),
 ]
@@ -70,6 +77,124 @@ class TestCoinaddr(unittest.TestCase):
                 self.assertEqual(True, res.valid)
                 self.assertEqual(net, res.network)
 
+    def test_validation_by_currency(self):
+        for name, ticker, addr, net in TEST_DATA:
+            with self.subTest(name=name, address=addr, net=net):
+                currency = Currencies.get(name)
+                for res in [coinaddr.validate(currency, addr),
+                            coinaddr.validate_many(currency, [addr])[0],
+                            ValidationRequest.from_currency(
+                                currency, addr).execute()]:
+                    self.assertEqual(name, res.name)
+                    self.assertEqual(addr, res.address)
+                    self.assertEqual(True, res.valid)
+                    self.assertEqual(net, res.network)
+
+    def test_validation_many(self):
+        for name, ticker, addr, net in TEST_DATA:
+            with self.subTest(name=name, address=addr, net=net):
+                results = coinaddr.validate_many(ticker, [addr, addr[:-1]])
+                self.assertEqual(2, len(results))
+                self.assertEqual(addr, results[0].address)
+                self.assertEqual(True, results[0].valid)
+                self.assertEqual(net, results[0].network)
+                self.assertEqual(addr[:-1], results[1].address)
+                self.assertEqual(False, results[1].valid)
+
+    def test_validation_many_malformed(self):
+        test_data = [
+            ('btc', b'1BoatSLRHtKNngkdXEeobR76b53LETtpy0', 'unknown'),
+            ('btc', b'1BoatSLRHtKNngkdXEeobR76b53LETtpy\xff', 'unknown'),
+            ('xrp', b'rf1BiGeXwwQoi8Z2ueFYTEXSwuJYfV2Jp0', 'unknown'),
+            ('xmr', b'', 'unknown'),
+            ('xmr', b'4' + b'z' * 94, 'unknown'),
+            ('xmr', b'4' + b'\xff' * 94, 'unknown'),
+            ('eth', b'0x900Ff070D37657cdF8016BcA0D60CB493EBf7f8\xff', 'both'),
+            ('bnb', b'bnb1usaafxe5tunqx0wmgv8dcq0meujlvq6fyfvw5\xff',
+             'unknown'),
+            ('btc', '1BoatSLRHtKNngkdXEeobR76b53LETtpy\xe9', 'unknown'),
+            ('xmr', '4' + '\xe9' * 94, 'unknown'),
+            ('eth', '0x900Ff070D37657cdF8016BcA0D60CB493EBf7f8\xe9', 'both'),
+            ('bnb', 'bnb1usaafxe5tunqx0wmgv8dcq0meujlvq6fyfvw5\xe9',
+             'unknown'),
+        ]
+        for ticker, addr, net in test_data:
+            with self.subTest(ticker=ticker, address=addr):
+                results = coinaddr.validate_many(ticker, [addr, addr])
+                self.assertEqual([False, False],
+                                 [res.valid for res in results])
+                self.assertEqual(net, results[0].network)
+
+    def test_validation_many_packed(self):
+        for name, ticker, addr, net in TEST_DATA:
+            with self.subTest(name=name, address=addr, net=net):
+                stride = len(addr) + 2
+                buf = b''.join(a.ljust(stride, b'\x00')
+                               for a in [addr, addr[:-1], addr])
+                flags = coinaddr.validate_many_packed(ticker, buf, stride)
+                self.assertEqual(bytearray([1, 0, 1]), flags)
+
+        with self.assertRaises(ValueError):
+            coinaddr.validate_many_packed('btc', b'\x00' * 35, 34)
+
+    def test_validation_many_packed_malformed(self):
+        addr = b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT'
+        rows = [addr, b'1BoatSLRHtKNngkdXEeobR76b53LETtpy0',
+                b'1BoatSLRHtKNngkdXEeobR76b53LETtpy\xff', b'', addr]
+        buf = b''.join(row.ljust(35, b'\x00') for row in rows)
+        flags = coinaddr.validate_many_packed('btc', buf, 35)
+        self.assertEqual(bytearray([1, 0, 0, 0, 1]), flags)
+
+        rows = [b'4' + b'z' * 94, b'4' + b'1' * 94]
+        buf = b''.join(row.ljust(95, b'\x00') for row in rows)
+        flags = coinaddr.validate_many_packed('xmr', buf, 95)
+        self.assertEqual(bytearray([0, 0]), flags)
+
+    def test_validation_many_workers(self):
+        addr = b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT'
+        addresses = [addr, addr[:-1]] * 300
+        expected = [True, False] * 300
+
+        results = coinaddr.validate_many('btc', addresses, workers=4)
+        self.assertEqual(expected, [res.valid for res in results])
+
+        buf = b''.join(a.ljust(35, b'\x00') for a in addresses)
+        flags = coinaddr.validate_many_packed('btc', buf, 35, workers=4)
+        self.assertEqual(bytearray(expected), flags)
+
+    def test_validation_rejects_bad_length(self):
+        addresses = [b'', b'1BoatSLRHtKNngkdXEeob',
+                     b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT' * 3]
+        for addr in addresses:
+            with self.subTest(address=addr):
+                res = coinaddr.validate('btc', addr)
+                self.assertEqual(False, res.valid)
+
+    def test_validation_rejects_bad_checksum(self):
+        test_data = [
+            ('btc', b'1BoatSLRHtKNngkdXEeobR76b53LETtpyU'),
+            ('eth', b'900fF070D37657cdF8016BcA0D60CB493EBf7f83'),
+            ('etc', b'0x900Ff070D37657cdF8016BcA0D60CB493EBf7f8E'),
+            ('eth', b'900Ff070D37657cdF8016BcA0D60CB493EBf7f8G'),
+            ('eth', b'900Ff070D37657cdF8016BcA0D60CB493EBf7f8'),
+        ]
+        for ticker, addr in test_data:
+            with self.subTest(ticker=ticker, address=addr):
+                res = coinaddr.validate(ticker, addr)
+                self.assertEqual(False, res.valid)
+
+    def test_validation_rejects_other_currency(self):
+        test_data = [
+            ('btc', b'LeF6vC9k1qfFDEj6UGjM5e4fwHtiKsakTd'),
+            ('ltc', b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT'),
+            ('doge', b'XsVkhTxLjzdXP1xZWtEFRj1mDhWcU6d8tE'),
+            ('xrp', b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT'),
+        ]
+        for ticker, addr in test_data:
+            with self.subTest(ticker=ticker, address=addr):
+                res = coinaddr.validate(ticker, addr)
+                self.assertEqual(False, res.valid)
+
 
 class TestExtendingCoinaddr(unittest.TestCase):
     def test_extending_currency(self):
@@ -113,6 +238,54 @@ class TestExtendingCoinaddr(unittest.TestCase):
         validator = Validators.get('new')
         self.assertEqual(NewValidator, validator)
 
+    def test_extending_base58check_validator(self):
+        class NewBase58CheckValidator(Base58CheckValidator):
+            name = 'NewBase58Check'
+
+        Currency('newbitcoin', ticker='nbtc', validator='NewBase58Check',
+                 networks=dict(main=(0x00, 0x05), test=(0x6f, 0xc4)))
+
+        res = coinaddr.validate('nbtc', b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT')
+        self.assertEqual(True, res.valid)
+        self.assertEqual('main', res.network)
+
+    def test_extending_monero_validator(self):
+        class NewMoneroValidator(MoneroValidator):
+            name = 'NewMonero'
+
+        networks = Currencies.get('xmr').networks
+        Currency('newmonero', ticker='nxmr', validator='NewMonero',
+                 networks=networks)
+
+        for name, ticker, addr, net in TEST_DATA:
+            if ticker != 'xmr':
+                continue
+            with self.subTest(address=addr, net=net):
+                res = coinaddr.validate('nxmr', addr)
+                self.assertEqual(True, res.valid)
+                self.assertEqual(net, res.network)
+
+    def test_overriding_validator(self):
+        Currency('overridecoin', ticker='orc', validator='override')
+
+        class OverrideValidator(ValidatorBase):
+            name = 'override'
+            network = 'both'
+
+            def validate(self):
+                return True
+
+        self.assertEqual(True, coinaddr.validate('orc', b'address').valid)
+
+        class NewOverrideValidator(ValidatorBase):
+            name = 'override'
+            network = 'both'
+
+            def validate(self):
+                return False
+
+        self.assertEqual(False, coinaddr.validate('orc', b'address').valid)
+
 
 if __name__ == '__main__':
     unittest.main()
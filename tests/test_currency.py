@@ -1,7 +1,10 @@
+import copy
+import pickle
 import unittest
 
 from coinaddr.interfaces import INamedInstanceContainer, ICurrency
 from coinaddr.currency import Currencies, Currency
+from coinaddr.validation import ValidationRequest
 
 
 class TestCurrency(unittest.TestCase):
@@ -13,6 +16,56 @@ class TestCurrency(unittest.TestCase):
             with self.subTest(currency=currency):
                 self.assertTrue(ICurrency.providedBy(currency))
 
+    def test_read_only(self):
+        currency = Currencies.get('xrp')
+        request = ValidationRequest(currency, b'')
+        with self.assertRaises(TypeError):
+            request.extras['charset'] = None
+        self.assertEqual(currency.charset, request.extras['charset'])
+
+    def test_copy(self):
+        currency = Currencies.get('xrp')
+        for clone in [pickle.loads(pickle.dumps(currency)),
+                      copy.deepcopy(currency)]:
+            with self.subTest(clone=clone):
+                self.assertEqual(currency.name, clone.name)
+                self.assertEqual(currency.networks, clone.networks)
+                self.assertEqual(currency.charset, clone.charset)
+
+    def test_get(self):
+        for currency in Currencies.instances.values():
+            with self.subTest(currency=currency):
+                self.assertIs(currency, Currencies.get(currency.name))
+                self.assertIs(currency, Currencies.get(currency.ticker))
+        self.assertIsNone(Currencies.get('unknown'))
+        self.assertEqual('default', Currencies.get('unknown', 'default'))
+
+    def test_get_overridden(self):
+        old = Currency('overcoin', ticker='ovc', validator='Base58Check')
+        new = Currency('overcoin', ticker='ovc2', validator='Base58Check')
+
+        self.assertIs(new, Currencies.get('overcoin'))
+        self.assertIs(new, Currencies.get('ovc2'))
+        self.assertIsNone(Currencies.get('ovc'))
+        self.assertIsNot(old, Currencies.get('overcoin'))
+
+    def test_get_deleted(self):
+        Currency('delcoin', ticker='dlc', validator='Base58Check')
+        del Currencies['delcoin']
+
+        self.assertIsNone(Currencies.get('delcoin'))
+        self.assertIsNone(Currencies.get('dlc'))
+
+    def test_get_shared_key(self):
+        Currency('aacoin', ticker='xxcoin', validator='Base58Check')
+        xx = Currency('xxcoin', ticker='bbcoin', validator='Base58Check')
+        aa = Currency('aacoin', ticker='cccoin', validator='Base58Check')
+
+        self.assertIs(aa, Currencies.get('aacoin'))
+        self.assertIs(aa, Currencies.get('cccoin'))
+        self.assertIs(xx, Currencies.get('xxcoin'))
+        self.assertIs(xx, Currencies.get('bbcoin'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from coinaddr.interfaces import (
@@ -23,6 +25,28 @@ class TestValidation(unittest.TestCase):
         self.assertTrue(
             IValidationResult.implementedBy(ValidationResult))
 
+    def test_immutable(self):
+        request = ValidationRequest(
+            'btc', b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT')
+        result = request.execute()
+        for obj, name in [(request, 'address'), (result, 'valid'),
+                          (Base58CheckValidator(request), 'request')]:
+            with self.subTest(obj=obj):
+                with self.assertRaises(AttributeError):
+                    setattr(obj, name, None)
+                with self.assertRaises(AttributeError):
+                    delattr(obj, name)
+                for clone in [pickle.loads(pickle.dumps(obj)),
+                              copy.copy(obj), copy.deepcopy(obj)]:
+                    self.assertEqual(repr(obj), repr(clone))
+                    with self.assertRaises(AttributeError):
+                        setattr(clone, name, None)
+
+    def test_unknown_currency(self):
+        with self.assertRaises(TypeError):
+            ValidationRequest(
+                'unknown', b'1BoatSLRHtKNngkdXEeobR76b53LETtpyT')
+
 
 if __name__ == '__main__':
     unittest.main()